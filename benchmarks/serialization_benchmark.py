@@ -0,0 +1,136 @@
+"""
+Serialization and bytes-on-the-wire benchmark for typical ticket payloads.
+
+Compares FastAPI's default path (jsonable_encoder + JSONResponse) with
+FastJSONResponse, and the response size uncompressed, gzipped and brotli
+compressed as sent by CompressionMiddleware.
+
+    python -m benchmarks.serialization_benchmark --items 40 --tickets 200
+"""
+
+import argparse
+import json
+import random
+import timeit
+import uuid
+from datetime import date, timedelta
+from decimal import Decimal
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from src.api import compression
+from src.api.responses import FastJSONResponse
+
+CATEGORIES = ["Dairy", "Beverages", "Cereales", "Fruit", "Cleaning", "Bakery"]
+
+
+def process_ticket_payload(items):
+    """
+    Shape of a /process_ticket response: the Gemini response is a JSON string
+    nested in the JSON body.
+    """
+    parsed = {
+        "date": date.today().isoformat(),
+        "supermarket": "Supermercado Synthetic",
+        "total": 0.0,
+        "items": [
+            {
+                "product_name": f"Product {n}",
+                "quantity": random.randint(1, 4),
+                "unit_price": round(random.uniform(0.5, 20), 2),
+                "category": random.choice(CATEGORIES),
+            }
+            for n in range(items)
+        ],
+    }
+    gemini_response = {
+        "candidates": [
+            {
+                "content": {"parts": [{"text": json.dumps(parsed)}], "role": "model"},
+                "finish_reason": "STOP",
+            }
+        ],
+        "usage_metadata": {"prompt_token_count": 1290, "total_token_count": 2100},
+        "parsed": parsed,
+    }
+    return {
+        "status": "success",
+        "message": "Model correctly processed the ticket image.",
+        "extracted_data": json.dumps(gemini_response),
+        "ticket_id": str(uuid.uuid4()),
+    }
+
+
+def ticket_list_payload(tickets, items):
+    """
+    Shape of a ticket list/export: native Decimal, date and UUID values.
+    """
+    today = date.today()
+    return [
+        {
+            "id": uuid.uuid4(),
+            "fecha_compra": today - timedelta(days=n),
+            "supermercado": "Supermercado Synthetic",
+            "total_ticket": Decimal("42.37"),
+            "items": [
+                {
+                    "id": uuid.uuid4(),
+                    "nombre_producto": f"Product {i}",
+                    "categoria": random.choice(CATEGORIES),
+                    "precio_unitario": Decimal("1.25"),
+                    "cantidad": Decimal("2.000"),
+                    "precio_total_linea": Decimal("2.50"),
+                    "fecha_item": today - timedelta(days=n),
+                }
+                for i in range(items)
+            ],
+        }
+        for n in range(tickets)
+    ]
+
+
+def time_ms(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1000
+
+
+def report(name, content, number):
+    default_ms = time_ms(lambda: JSONResponse(jsonable_encoder(content)), number)
+    fast_ms = time_ms(lambda: FastJSONResponse(content), number)
+    body = FastJSONResponse(content).body
+
+    print(f"{name}")
+    print(f"  default encoder : {default_ms:8.3f} ms")
+    print(f"  FastJSONResponse: {fast_ms:8.3f} ms ({default_ms / fast_ms:.1f}x)")
+    print(f"  identity        : {len(body):8d} bytes")
+    for encoding in ("gzip", "br"):
+        if encoding == "br" and compression.brotli is None:
+            print("  br              : Brotli not installed")
+            continue
+        started = timeit.default_timer()
+        compressed = compression.compress(body, encoding, 6, 4)
+        elapsed = (timeit.default_timer() - started) * 1000
+        print(
+            f"  {encoding:<16}: {len(compressed):8d} bytes "
+            f"({len(compressed) / len(body):.0%}, {elapsed:.3f} ms)"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=40, help="Items per ticket")
+    parser.add_argument("--tickets", type=int, default=200, help="Tickets per list")
+    parser.add_argument("--number", type=int, default=50, help="Calls per timing")
+    args = parser.parse_args()
+
+    random.seed(0)
+    report("/process_ticket response", process_ticket_payload(args.items), args.number)
+    report(
+        f"ticket list ({args.tickets} tickets)",
+        ticket_list_payload(args.tickets, args.items),
+        max(1, args.number // 10),
+    )
+
+
+if __name__ == "__main__":
+    main()
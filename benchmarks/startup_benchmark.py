@@ -0,0 +1,122 @@
+"""
+Startup-time benchmark for the backend.
+
+Each run starts a fresh interpreter (as a new worker would), then measures:
+
+- import_ms: `import src.main`.
+- health_ms: first GET /health, including the lifespan startup. It touches
+  neither the database nor Gemini, so it only covers the app stack.
+- first_real_request_ms: first request to a benchmark-only route that depends
+  on `get_db` and runs `SELECT 1` (so `get_engine()` creates the pool and
+  opens a connection) and calls `gemini_service.get_client()` (the client is
+  built, but no Gemini call is made). This is the cost the lazy initializers
+  add to the first real request of a worker.
+- engine_ms / gemini_client_ms: the part of that request spent in each initializer.
+
+The database defaults to a scratch SQLite file. Pass --database-url (or set
+DATABASE_URL) to measure against PostgreSQL.
+
+    python -m benchmarks.startup_benchmark --runs 10
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+# Runs in a fresh interpreter and prints its timings as JSON
+RUN_ONCE = """
+import json
+import time
+
+started = time.perf_counter()
+from src.main import app
+imported = time.perf_counter()
+
+from fastapi import Depends
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from src.database.connection import get_db
+from src.services import gemini_service
+
+timings = {}
+
+
+@app.get("/__benchmark")
+def first_real_request(db=Depends(get_db)):
+    engine_started = time.perf_counter()
+    db.execute(text("SELECT 1"))
+    client_started = time.perf_counter()
+    gemini_service.get_client()
+    timings["engine_ms"] = (client_started - engine_started) * 1000
+    timings["gemini_client_ms"] = (time.perf_counter() - client_started) * 1000
+    return {"status": "ok"}
+
+
+def timed_get(client, url):
+    request_started = time.perf_counter()
+    response = client.get(url)
+    elapsed = time.perf_counter() - request_started
+    response.raise_for_status()
+    return elapsed * 1000
+
+
+with TestClient(app) as client:
+    timings["health_ms"] = timed_get(client, "/health")
+    timings["first_real_request_ms"] = timed_get(client, "/__benchmark")
+
+timings["import_ms"] = (imported - started) * 1000
+print(json.dumps(timings))
+"""
+
+KEYS = (
+    "import_ms",
+    "health_ms",
+    "first_real_request_ms",
+    "engine_ms",
+    "gemini_client_ms",
+)
+
+
+def run_once(env):
+    output = subprocess.run(
+        [sys.executable, "-c", RUN_ONCE],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as scratch:
+        env = dict(os.environ)
+        env["DATABASE_URL"] = (
+            args.database_url or f"sqlite:///{os.path.join(scratch, 'benchmark.db')}"
+        )
+        # Only used to build the client, Gemini itself is never called
+        env.setdefault("GEMINI_API_KEY", "benchmark")
+        env["DATABASE_REPLICA_URLS"] = ""
+
+        results = [run_once(env) for _ in range(args.runs)]
+
+    for key in KEYS:
+        values = sorted(result[key] for result in results)
+        print(
+            f"{key}: median {statistics.median(values):.1f} ms, "
+            f"min {values[0]:.1f} ms, max {values[-1]:.1f} ms ({args.runs} runs)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Synthetic multi-household benchmark for tenant-scoped item queries.
+
+Fills the database pointed to by DATABASE_URL with thousands of households,
+then times per-household category/date range queries and shows the plan so
+partition pruning and the (household_id, fecha_item) index can be checked.
+
+Use a scratch database, this script inserts a lot of rows:
+
+    alembic upgrade head
+    python -m benchmarks.tenancy_benchmark --households 5000 --months 12
+"""
+
+import argparse
+import random
+import statistics
+import time
+import uuid
+from datetime import date, timedelta
+
+from sqlalchemy import insert, text
+
+from src.database import crud, partitions
+from src.database.connection import SessionLocal
+from src.database.models import Item, Ticket
+
+CATEGORIES = ["Dairy", "Beverages", "Cereales", "Fruit", "Cleaning", "Bakery"]
+
+
+def populate(db, households, months, tickets_per_month, items_per_ticket):
+    today = date.today()
+    first_day = (today.replace(day=1) - timedelta(days=31 * (months - 1))).replace(
+        day=1
+    )
+    span_days = (today - first_day).days
+
+    partitions.ensure_item_partitions(
+        db.connection(), partitions.partition_window(today, months, 0)
+    )
+    db.commit()
+
+    for n in range(households):
+        household_id = f"household-{n}"
+        tickets, items = [], []
+        for _ in range(months * tickets_per_month):
+            ticket_id = uuid.uuid4()
+            ticket_date = first_day + timedelta(days=random.randint(0, span_days))
+            tickets.append(
+                {
+                    "id": ticket_id,
+                    "household_id": household_id,
+                    "fecha_compra": ticket_date,
+                    "total_ticket": 0,
+                }
+            )
+            for _ in range(items_per_ticket):
+                price = round(random.uniform(0.5, 20), 2)
+                items.append(
+                    {
+                        "id": uuid.uuid4(),
+                        "household_id": household_id,
+                        "ticket_id": ticket_id,
+                        "nombre_producto": "synthetic",
+                        "categoria": random.choice(CATEGORIES),
+                        "precio_unitario": price,
+                        "cantidad": 1,
+                        "precio_total_linea": price,
+                        "fecha_item": ticket_date,
+                    }
+                )
+        db.execute(insert(Ticket), tickets)
+        db.execute(insert(Item), items)
+        if n % 100 == 99:
+            db.commit()
+            print(f"  {n + 1}/{households} households inserted")
+    db.commit()
+    db.execute(text("ANALYZE tickets"))
+    db.execute(text("ANALYZE items"))
+    db.commit()
+
+
+def run_queries(db, households, samples):
+    end_date = date.today()
+    start_date = end_date.replace(day=1)
+    timings = []
+    for _ in range(samples):
+        household_id = f"household-{random.randrange(households)}"
+        category = random.choice(CATEGORIES)
+        started = time.perf_counter()
+        crud.get_items_by_category_and_date_range(
+            db, household_id, category, start_date, end_date
+        )
+        timings.append((time.perf_counter() - started) * 1000)
+
+    timings.sort()
+    print(
+        f"Per-household monthly category query over {samples} samples: "
+        f"median {statistics.median(timings):.2f} ms, "
+        f"p95 {timings[int(len(timings) * 0.95) - 1]:.2f} ms"
+    )
+
+    plan = db.execute(
+        text(
+            "EXPLAIN SELECT * FROM items WHERE household_id = :household_id "
+            "AND categoria = :category AND fecha_item BETWEEN :start AND :end"
+        ),
+        {
+            "household_id": "household-0",
+            "category": CATEGORIES[0],
+            "start": start_date,
+            "end": end_date,
+        },
+    )
+    print("Query plan:")
+    for (line,) in plan:
+        print(f"  {line}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--households", type=int, default=2000)
+    parser.add_argument("--months", type=int, default=12)
+    parser.add_argument("--tickets-per-month", type=int, default=4)
+    parser.add_argument("--items-per-ticket", type=int, default=10)
+    parser.add_argument("--samples", type=int, default=500)
+    parser.add_argument(
+        "--skip-populate", action="store_true", help="Reuse already inserted data"
+    )
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if not args.skip_populate:
+            print(f"Populating {args.households} households...")
+            started = time.perf_counter()
+            populate(
+                db,
+                args.households,
+                args.months,
+                args.tickets_per_month,
+                args.items_per_ticket,
+            )
+            print(f"Populated in {time.perf_counter() - started:.1f} s")
+        run_queries(db, args.households, args.samples)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
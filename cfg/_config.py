@@ -2,6 +2,7 @@ import datetime
 import os
 import sys
 from pathlib import Path
+from typing import Optional
 
 from dotenv import load_dotenv
 
@@ -49,12 +50,36 @@ class Settings(BaseSettings, case_sensitive=False, extra="ignore"):
     # Base folder for storing logs (default: hs/logs)
     logs_storage_folder: str = str(PROJECT_ROOT.joinpath(library_prefix, "logs"))
     # Gemini API key
-    gemini_api_key: str = os.getenv("GEMINI_API_KEY")
+    gemini_api_key: Optional[str] = os.getenv("GEMINI_API_KEY")
 
     # model id
     model_id: str = "gemini-2.5-flash-preview-05-20"
 
-    database_url: str = os.getenv("DATABASE_URL")
+    database_url: Optional[str] = os.getenv("DATABASE_URL")
+
+    # Comma separated read replica URLs for analytics reads (empty: primary only)
+    database_replica_urls: str = os.getenv("DATABASE_REPLICA_URLS", "")
+
+    # Seconds a household's reads stay on the primary after it saves a ticket
+    replica_sticky_seconds: float = 5.0
+
+    # Seconds between health checks of a read replica
+    replica_health_check_interval: float = 10.0
+
+    # Replicas lagging more than this many seconds behind the primary are not used
+    replica_max_lag_seconds: float = 5.0
+
+    # Household that data stored before multi-household tenancy is migrated to
+    default_household_id: str = "default"
+
+    # Responses smaller than this many bytes are sent uncompressed
+    compression_minimum_size: int = 1024
+
+    # Seconds a completed /process_ticket result is kept for idempotent retries
+    idempotency_ttl_seconds: int = 24 * 60 * 60
+
+    # Completed /process_ticket results kept for idempotent retries (two keys per upload at most)
+    idempotency_max_entries: int = 10_000
 
 
 def config_logger(
@@ -14,10 +14,13 @@ import {
 import * as ImagePicker from 'expo-image-picker';
 import axios from 'axios';
 
-import { LOCAL_IP } from '@env';
+import { LOCAL_IP, HOUSEHOLD_ID } from '@env';
 
 const BACKEND_URL = `http://${LOCAL_IP}:8000/api/v1`;
 
+// Household (tenant) every request acts on, required by the backend
+const HOUSEHOLD_HEADERS = { 'X-Household-Id': HOUSEHOLD_ID };
+
 export default function App() {
   const [selectedImageUri, setSelectedImageUri] = useState(null);
   const [selectedImageBase64, setSelectedImageBase64] = useState(null);
@@ -118,6 +121,7 @@ export default function App() {
       const response = await axios.post(`${BACKEND_URL}/process_ticket`, requestData, {
         headers: {
           'Content-Type': 'application/json',
+          ...HOUSEHOLD_HEADERS,
         },
       });
 
@@ -149,6 +153,8 @@ export default function App() {
     try {
       const response = await axios.post(`${BACKEND_URL}/process_voice_command`, {
         command_text: voiceCommand,
+      }, {
+        headers: HOUSEHOLD_HEADERS,
       });
       setVoiceResponse(`Voice command response:\n${JSON.stringify(response.data, null, 2)}`);
     } catch (error) {
@@ -0,0 +1,139 @@
+import gzip
+from typing import Optional
+
+import anyio.to_thread
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # Brotli is optional, gzip is always available
+    brotli = None
+
+# Content types that are already compressed, or must not be buffered
+EXCLUDED_CONTENT_TYPES = ("image/", "audio/", "video/", "text/event-stream")
+
+# Bodies from this size on are compressed in a worker thread, not on the event loop
+THREAD_MINIMUM_SIZE = 128 * 1024
+
+
+def _accepted_encodings(accept_encoding: str) -> set:
+    """
+    Returns the encodings accepted by the client, ignoring those with q=0.
+    """
+    accepted = set()
+    for part in accept_encoding.split(","):
+        name, *params = part.split(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        refused = False
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    refused = float(value) == 0
+                except ValueError:
+                    pass
+        if not refused:
+            accepted.add(name)
+    return accepted
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Picks the response encoding for an Accept-Encoding header: brotli when the
+    client accepts it and the Brotli package is installed, then gzip.
+    """
+    accepted = _accepted_encodings(accept_encoding)
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def compress(body: bytes, encoding: str, gzip_level: int, brotli_quality: int):
+    if encoding == "br":
+        return brotli.compress(body, quality=brotli_quality)
+    return gzip.compress(body, compresslevel=gzip_level)
+
+
+class CompressionMiddleware:
+    """
+    Compresses responses with brotli or gzip, negotiated through Accept-Encoding.
+
+    Only complete (non streaming) responses of at least `minimum_size` bytes are
+    compressed; streaming responses and already encoded bodies pass through
+    untouched.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+
+        async def send_compressed(message: Message):
+            nonlocal start_message
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                content_type = headers.get("content-type", "")
+                if "content-encoding" in headers or content_type.startswith(
+                    EXCLUDED_CONTENT_TYPES
+                ):
+                    await send(message)
+                else:
+                    # Hold the headers until we know whether the body gets compressed
+                    start_message = message
+                return
+
+            if message["type"] != "http.response.body" or start_message is None:
+                # Passthrough responses, later chunks of a streaming response,
+                # or non body messages (e.g. pathsend) that only need the headers out first
+                if start_message is not None:
+                    await send(start_message)
+                    start_message = None
+                await send(message)
+                return
+
+            headers = MutableHeaders(raw=start_message["headers"])
+            headers.add_vary_header("Accept-Encoding")
+            body = message.get("body", b"")
+            if not message.get("more_body", False) and len(body) >= self.minimum_size:
+                if len(body) >= THREAD_MINIMUM_SIZE:
+                    body = await anyio.to_thread.run_sync(
+                        compress, body, encoding, self.gzip_level, self.brotli_quality
+                    )
+                else:
+                    body = compress(
+                        body, encoding, self.gzip_level, self.brotli_quality
+                    )
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(body))
+                message["body"] = body
+
+            await send(start_message)
+            start_message = None
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
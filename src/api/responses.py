@@ -0,0 +1,34 @@
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+def _default(obj: Any):
+    """
+    orjson fallback for the types it does not serialize natively.
+    (date, datetime and UUID values are handled by orjson itself)
+    """
+    if isinstance(obj, Decimal):
+        # Same convention as FastAPI's encoder: int when integral, float otherwise
+        return int(obj) if obj.as_tuple().exponent >= 0 else float(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class FastJSONResponse(ORJSONResponse):
+    """
+    JSON response rendered with orjson, without FastAPI's `jsonable_encoder` pass.
+
+    Return it directly from routes (`return FastJSONResponse(content)`) so the
+    content is serialized once, in native code. Handles Pydantic models, Decimal,
+    date/datetime and UUID values.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
@@ -1,14 +1,17 @@
 import json
+import re
 from datetime import date, timedelta
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from cfg import logger
+from src.api.responses import FastJSONResponse
 from src.database import crud
-from src.database.connection import get_db
-from src.services import gemini_service
+from src.database.connection import SessionLocal, get_db
+from src.services import gemini_service, idempotency_service
 
 router = APIRouter()
 
@@ -22,17 +25,56 @@ class VoiceCommandRequest(BaseModel):
     command_text: str
 
 
+# Household ids: letters, digits, '-' and '_' (e.g. a UUID or a slug)
+HOUSEHOLD_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+
+def get_household_id(
+    x_household_id: Optional[str] = Header(default=None, alias="X-Household-Id"),
+) -> str:
+    """
+    Dependency returning the household (tenant) a request acts on.
+
+    NOTE: placeholder until authentication exists. The household comes from the
+    client's X-Household-Id header, which is only validated for format, so any
+    client can act on any household it knows the id of.
+    """
+    if not x_household_id:
+        raise HTTPException(status_code=400, detail="Missing X-Household-Id header")
+    if not HOUSEHOLD_ID_PATTERN.match(x_household_id):
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid X-Household-Id: use 1-64 letters, digits, '-' or '_'",
+        )
+    return x_household_id
+
+
+# Longest accepted Idempotency-Key header
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+
+
 @router.post("/process_ticket")
 async def process_ticket_endpoint(
-    request: ProcessTicketRequest, db: Session = Depends(get_db)
+    request: ProcessTicketRequest,
+    household_id: str = Depends(get_household_id),
+    idempotency_key: Optional[str] = Header(default=None, alias="Idempotency-Key"),
 ):
     """
     Endpoint to process a ticket image using  AI.
     Expects a Base64 encoded image and a prompt for to extract data.
     Returns a JSON response with the extracted data.
     If an error occurs, it raises an HTTPException with a 500 status code.
+
+    Retries carrying the same `Idempotency-Key` header, or uploading the same
+    image, share a single model call and ticket row and get the same response.
     """
-    try:
+    if idempotency_key and len(idempotency_key) > IDEMPOTENCY_KEY_MAX_LENGTH:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Idempotency-Key must be at most {IDEMPOTENCY_KEY_MAX_LENGTH} characters",
+        )
+
+    async def process_ticket():
         model_response_data = await gemini_service.process_image_with_gemini(
             base64_image=request.image_base64, prompt=request.model_prompt
         )
@@ -42,13 +84,40 @@ async def process_ticket_endpoint(
         response = json.loads(model_response_data)
         print(response.get("parsed"))
         # TODO BD logic
-        ticket_db = crud.save_gemini_ticket_data(db, response.get("parsed", {}))
+        # The shared computation can outlive the request that started it, so it
+        # owns its session instead of borrowing the request scoped one
+        db = SessionLocal()
+        try:
+            ticket_db = crud.save_gemini_ticket_data(
+                db, household_id, response.get("parsed", {})
+            )
+            ticket_id = str(ticket_db.id)
+        finally:
+            db.close()
         return {
             "status": "success",
             "message": "Model correctly processed the ticket image.",
             "extracted_data": model_response_data,
-            "ticket_id": str(ticket_db.id),
+            "ticket_id": ticket_id,
         }
+
+    image_hash = idempotency_service.image_hash(
+        request.image_base64, request.model_prompt
+    )
+    keys = [f"{household_id}:image:{image_hash}"]
+    if idempotency_key:
+        keys.insert(0, f"{household_id}:key:{idempotency_key}")
+
+    try:
+        return FastJSONResponse(
+            await idempotency_service.ticket_cache.run(keys, image_hash, process_ticket)
+        )
+    except idempotency_service.IdempotencyKeyMismatch as e:
+        logger.warning(f"Rejected /process_ticket: {e}")
+        raise HTTPException(
+            status_code=422,
+            detail="Idempotency-Key was already used with a different ticket image",
+        )
     except Exception as e:
         logger.exception(f"Error in /process_ticket: {e}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
@@ -56,7 +125,9 @@ async def process_ticket_endpoint(
 
 @router.post("/process_voice_command")
 async def process_voice_command_endpoint(
-    request: VoiceCommandRequest, db: Session = Depends(get_db)
+    request: VoiceCommandRequest,
+    db: Session = Depends(get_db),
+    household_id: str = Depends(get_household_id),
 ):
     """
     Endpoint para procesar un comando de voz (texto) usando Gemini
@@ -89,10 +160,12 @@ async def process_voice_command_endpoint(
                     response_message = (
                         "Periodo no válido. Usa 'day', 'week', 'month' o 'year'."
                     )
-                    return {"status": "error", "response": response_message}
+                    return FastJSONResponse(
+                        {"status": "error", "response": response_message}
+                    )
 
                 items = crud.get_items_by_category_and_date_range(
-                    db, categoria, start_date, end_date
+                    db, household_id, categoria, start_date, end_date
                 )
                 total_gasto = sum(item.precio_total_linea for item in items)
                 response_message = f"Your spending on {categoria} during the last {periodo} is {total_gasto:.2f}€."
@@ -116,11 +189,13 @@ async def process_voice_command_endpoint(
         else:
             response_message = "Received command: '{request.command_text}'. Gemini interpreted it as: {model_interpretation}. I can't perform that action yet."
 
-        return {
-            "status": "success",
-            "response": response_message,
-            "gemini_interpretation": model_interpretation,
-        }
+        return FastJSONResponse(
+            {
+                "status": "success",
+                "response": response_message,
+                "gemini_interpretation": model_interpretation,
+            }
+        )
 
     except Exception as e:
         logger.exception(f"Error en /procesar_comando_voz: {e}")
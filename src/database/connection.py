@@ -1,21 +1,230 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import asyncio
+import functools
+import itertools
+import time
 
-from cfg import settings
-from src.database.models import Base
+from sqlalchemy import Delete, Insert, Update, create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.schema import ExecutableDDLElement
+from sqlalchemy.sql.elements import TextClause
 
-# Create the SQLAlchemy engine using the database URL from settings
-engine = create_engine(settings.database_url)
+from cfg import logger, settings
 
+# Engines (and their connection pools) are created on first use and shared by
+# the whole process, so importing this module does not touch the database.
+# The schema is managed with Alembic migrations (see src/database/migrations).
 
-# Create all tables defined in Base (only if they don't exist)
-# This is used to initialize the DB, not for complex migrations
-def create_db_and_tables():
-    Base.metadata.create_all(engine)
+# replica engine -> healthy, updated by `monitor_replicas` (unknown counts as unhealthy)
+_replica_health = {}
+
+# household_id -> monotonic time of its last committed write
+# NOTE: per process, so read-your-writes only holds within one worker; with
+# several uvicorn workers a retry served by another worker may read a replica
+_last_write_at = {}
+
+# Replication lag in seconds, 0 when the replica has replayed all it received
+# (an idle primary would otherwise look lagged) and on a server that is not a replica
+_REPLICA_LAG_SQL = """
+SELECT COALESCE(
+    CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END,
+    0)
+"""
+
+# Leading keywords of textual SQL that only reads
+_READ_ONLY_SQL = ("SELECT", "SHOW", "EXPLAIN", "VALUES")
+
+
+@functools.lru_cache(maxsize=None)
+def get_engine():
+    """
+    Returns the SQLAlchemy engine of the primary database. All writes go here.
+    """
+    return create_engine(settings.database_url)
+
+
+@functools.lru_cache(maxsize=None)
+def get_replica_engines():
+    """
+    Returns the read replica engines, used by the CRUD functions decorated with `replica_read`.
+    """
+    return [
+        create_engine(url.strip(), connect_args={"connect_timeout": 2})
+        for url in settings.database_replica_urls.split(",")
+        if url.strip()
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def _get_replica_cycle():
+    return itertools.cycle(get_replica_engines())
+
+
+def dispose_engines():
+    """
+    Closes the connection pools of every engine created so far.
+    """
+    if get_engine.cache_info().currsize:
+        get_engine().dispose()
+    if get_replica_engines.cache_info().currsize:
+        for replica in get_replica_engines():
+            replica.dispose()
+
+
+def check_replica(replica) -> bool:
+    """
+    Returns True if the replica answers and lags at most `replica_max_lag_seconds`.
+    Blocking, call it off the event loop.
+    """
+    try:
+        with replica.connect() as conn:
+            lag = float(conn.execute(text(_REPLICA_LAG_SQL)).scalar())
+    except Exception as e:
+        # Any failure (connection, driver, SQL) must leave the replica out
+        # rather than end the monitor with a stale health state
+        logger.warning(f"⚠️ Read replica {replica.url.host} failed health check: {e}")
+        return False
+    if lag > settings.replica_max_lag_seconds:
+        logger.warning(f"⚠️ Read replica {replica.url.host} is {lag:.1f}s behind")
+        return False
+    return True
+
+
+def check_replicas():
+    """
+    Refreshes the health of every replica. Blocking, call it off the event loop.
+    """
+    for replica in get_replica_engines():
+        _replica_health[replica] = check_replica(replica)
+
+
+async def monitor_replicas():
+    """
+    Background task refreshing the replicas health every `replica_health_check_interval`.
+
+    Checks run in a worker thread so a dead replica never blocks the event loop.
+    Until the first check completes, reads go to the primary.
+    """
+    while True:
+        try:
+            await asyncio.to_thread(check_replicas)
+        except Exception as e:
+            logger.exception(f"⚠️ Read replica health check failed: {e}")
+            for replica in get_replica_engines():
+                mark_replica_unhealthy(replica)
+        await asyncio.sleep(settings.replica_health_check_interval)
+
+
+def mark_replica_unhealthy(replica):
+    _replica_health[replica] = False
+
+
+def _pick_replica():
+    """
+    Returns the next healthy replica (round robin), or None if none is healthy.
+    """
+    replica_cycle = _get_replica_cycle()
+    for _ in range(len(get_replica_engines())):
+        replica = next(replica_cycle)
+        if _replica_health.get(replica, False):
+            return replica
+    return None
+
+
+def mark_primary_write(household_id: str):
+    """
+    Records that household_id just committed a write, so that its reads stick
+    to the primary until the replicas have had time to catch up.
+    """
+    now = time.monotonic()
+    expired = [
+        key
+        for key, written_at in _last_write_at.items()
+        if now - written_at > settings.replica_sticky_seconds
+    ]
+    for key in expired:
+        del _last_write_at[key]
+    _last_write_at[household_id] = now
+
+
+def _is_sticky(household_id: str) -> bool:
+    written_at = _last_write_at.get(household_id)
+    return (
+        written_at is not None
+        and time.monotonic() - written_at <= settings.replica_sticky_seconds
+    )
+
+
+def _is_write(mapper, clause) -> bool:
+    if clause is None:
+        # Session.connection(): raw access, may run anything
+        return mapper is None
+    if isinstance(clause, (Insert, Update, Delete, ExecutableDDLElement)):
+        return True
+    if isinstance(clause, TextClause):
+        return not clause.text.lstrip().upper().startswith(_READ_ONLY_SQL)
+    return False
+
+
+class RoutingSession(Session):
+    """
+    Session that sends reads to a replica while `info["use_replica"]` is set,
+    and everything else (writes, flushes, reads after a write) to the primary.
+
+    Any write (ORM flush, DML/DDL constructs, textual SQL that is not a plain
+    read, raw connection access) marks the session, so its later reads stay on
+    the primary and see the uncommitted changes.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self._flushing or _is_write(mapper, clause):
+            self.info["has_writes"] = True
+            return get_engine()
+        if self.info.get("use_replica") and not self.info.get("has_writes"):
+            replica = _pick_replica()
+            if replica is not None:
+                self.info["replica"] = replica
+                return replica
+        return get_engine()
+
+
+def replica_read(func):
+    """
+    Decorator for read-only CRUD functions taking `(db, household_id, ...)`.
+
+    Runs the query on a read replica unless the session or the household has
+    recently written, and falls back to the primary if the replica fails.
+    """
+
+    @functools.wraps(func)
+    def wrapper(db: Session, household_id: str, *args, **kwargs):
+        if (
+            not get_replica_engines()
+            or db.info.get("has_writes")
+            or _is_sticky(household_id)
+        ):
+            return func(db, household_id, *args, **kwargs)
+
+        db.info["use_replica"] = True
+        db.info.pop("replica", None)
+        try:
+            return func(db, household_id, *args, **kwargs)
+        except OperationalError as e:
+            replica = db.info.get("replica")
+            logger.warning(f"⚠️ Read replica failed, retrying on primary: {e}")
+            if replica is not None:
+                mark_replica_unhealthy(replica)
+            db.rollback()
+        finally:
+            db.info["use_replica"] = False
+        return func(db, household_id, *args, **kwargs)
+
+    return wrapper
 
 
 # Configure the session to interact with the DB
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False)
 
 
 # Dependency for FastAPI to get a DB session for each request
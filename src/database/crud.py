@@ -3,17 +3,20 @@ from datetime import date
 
 from sqlalchemy.orm import Session
 
+from src.database.connection import mark_primary_write, replica_read
 from src.database.models import Item, Ticket
 
 
 def create_ticket(
     db: Session,
+    household_id: str,
     date: date,
     total_ticket: float,
     raw_gemini_data: dict,
     supermarket: str = None,
 ):
     db_ticket = Ticket(
+        household_id=household_id,
         fecha_compra=date,
         supermercado=supermarket,
         total_ticket=total_ticket,
@@ -25,12 +28,18 @@ def create_ticket(
     return db_ticket
 
 
-def get_ticket(db: Session, ticket_id: str):
-    return db.query(Ticket).filter(Ticket.id == ticket_id).first()
+@replica_read
+def get_ticket(db: Session, household_id: str, ticket_id: str):
+    return (
+        db.query(Ticket)
+        .filter(Ticket.household_id == household_id, Ticket.id == ticket_id)
+        .first()
+    )
 
 
 def create_item(
     db: Session,
+    household_id: str,
     ticket_id: str,
     product_name: str,
     unit_price: float,
@@ -40,6 +49,7 @@ def create_item(
     category: str = None,
 ):
     db_item = Item(
+        household_id=household_id,
         ticket_id=ticket_id,
         nombre_producto=product_name,
         categoria=category,
@@ -54,16 +64,23 @@ def create_item(
     return db_item
 
 
-def get_items_by_ticket(db: Session, ticket_id: str):
-    return db.query(Item).filter(Item.ticket_id == ticket_id).all()
+@replica_read
+def get_items_by_ticket(db: Session, household_id: str, ticket_id: str):
+    return (
+        db.query(Item)
+        .filter(Item.household_id == household_id, Item.ticket_id == ticket_id)
+        .all()
+    )
 
 
+@replica_read
 def get_items_by_category_and_date_range(
-    db: Session, category: str, start_date: date, end_date: date
+    db: Session, household_id: str, category: str, start_date: date, end_date: date
 ):
     return (
         db.query(Item)
         .filter(
+            Item.household_id == household_id,
             Item.categoria == category,
             Item.fecha_item >= start_date,
             Item.fecha_item <= end_date,
@@ -72,7 +89,9 @@ def get_items_by_category_and_date_range(
     )
 
 
-def save_gemini_ticket_data(db: Session, gemini_extracted_data: dict):
+def save_gemini_ticket_data(
+    db: Session, household_id: str, gemini_extracted_data: dict
+):
     try:
         fecha_str = gemini_extracted_data.get("date") or str(date.today())
         try:
@@ -84,7 +103,12 @@ def save_gemini_ticket_data(db: Session, gemini_extracted_data: dict):
         supermarket = gemini_extracted_data.get("supermarket")
 
         db_ticket = create_ticket(
-            db, item_date, total_ticket, gemini_extracted_data, supermarket
+            db,
+            household_id,
+            item_date,
+            total_ticket,
+            gemini_extracted_data,
+            supermarket,
         )
 
         items_list = gemini_extracted_data.get("items", [])
@@ -102,6 +126,7 @@ def save_gemini_ticket_data(db: Session, gemini_extracted_data: dict):
             if name and line_total_price is not None:
                 create_item(
                     db,
+                    household_id,
                     db_ticket.id,
                     name,
                     unit_price,
@@ -111,6 +136,7 @@ def save_gemini_ticket_data(db: Session, gemini_extracted_data: dict):
                     category=category,
                 )
         db.commit()
+        mark_primary_write(household_id)
         return db_ticket
 
     except Exception as e:
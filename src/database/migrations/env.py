@@ -0,0 +1,66 @@
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine, pool
+
+from cfg import settings
+from src.database.models import Base
+
+# Alembic Config object, gives access to the values of alembic.ini
+config = context.config
+
+# Set up Python logging from alembic.ini
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+# Models metadata, used by `alembic revision --autogenerate`
+target_metadata = Base.metadata
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """
+    Leaves the `items` partitions (managed by src/database/partitions.py) out of autogenerate.
+    """
+    table = object if type_ == "table" else getattr(object, "table", None)
+    if reflected and compare_to is None and table is not None:
+        return not table.name.startswith("items_")
+    return True
+
+
+def run_migrations_offline() -> None:
+    """
+    Run migrations in 'offline' mode: emits the SQL instead of running it.
+    """
+    context.configure(
+        url=settings.database_url,
+        target_metadata=target_metadata,
+        include_object=include_object,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """
+    Run migrations in 'online' mode against the primary database.
+    """
+    connectable = create_engine(settings.database_url, poolclass=pool.NullPool)
+
+    with connectable.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,56 @@
+"""Baseline schema, as created by the original create_all on startup
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 00:00:00.000000
+
+Databases created before migrations existed already have these tables:
+mark them with `alembic stamp 0001`, then run `alembic upgrade head`.
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "tickets",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("fecha_compra", sa.Date(), nullable=False),
+        sa.Column("supermercado", sa.String()),
+        sa.Column("total_ticket", sa.Numeric(10, 2), nullable=False),
+        sa.Column("raw_gemini_data", postgresql.JSONB()),
+    )
+    op.create_table(
+        "items",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "ticket_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("tickets.id"),
+            nullable=False,
+        ),
+        sa.Column("nombre_producto", sa.String(), nullable=False),
+        sa.Column("categoria", sa.String()),
+        sa.Column("precio_unitario", sa.Numeric(10, 2)),
+        sa.Column("cantidad", sa.Numeric(10, 3)),
+        sa.Column("precio_total_linea", sa.Numeric(10, 2), nullable=False),
+        sa.Column("fecha_item", sa.Date(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("items")
+    op.drop_table("tickets")
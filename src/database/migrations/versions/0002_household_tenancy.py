@@ -0,0 +1,163 @@
+"""Household tenancy and month partitioned items
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:00:00.000000
+
+Existing tickets and items are assigned to DEFAULT_HOUSEHOLD_ID. The items
+table is rebuilt as a partitioned table and its rows are copied over: monthly
+partitions are created for the months holding data (within a plausible date
+range) and for the upcoming months, everything else goes to the DEFAULT
+partition.
+
+"""
+
+from datetime import date
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import context, op
+from sqlalchemy.dialects import postgresql
+
+from cfg import settings
+from src.database import partitions
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Item dates outside this many years around today are treated as misread
+PLAUSIBLE_YEARS_BACK = 10
+PLAUSIBLE_YEARS_AHEAD = 1
+
+ITEM_COLUMNS = (
+    "id, ticket_id, nombre_producto, categoria, precio_unitario, cantidad, "
+    "precio_total_linea, fecha_item"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("tickets", sa.Column("household_id", sa.String(), nullable=True))
+    op.execute(
+        sa.text("UPDATE tickets SET household_id = :household_id").bindparams(
+            household_id=settings.default_household_id
+        )
+    )
+    op.alter_column("tickets", "household_id", nullable=False)
+    op.create_index(
+        "ix_tickets_household_id_fecha_compra",
+        "tickets",
+        ["household_id", "fecha_compra"],
+    )
+
+    # Keep the old table aside (its primary key index name would clash)
+    op.rename_table("items", "items_unpartitioned")
+    op.execute("ALTER INDEX items_pkey RENAME TO items_unpartitioned_pkey")
+
+    op.create_table(
+        "items",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("household_id", sa.String(), nullable=False),
+        sa.Column(
+            "ticket_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("tickets.id"),
+            nullable=False,
+        ),
+        sa.Column("nombre_producto", sa.String(), nullable=False),
+        sa.Column("categoria", sa.String()),
+        sa.Column("precio_unitario", sa.Numeric(10, 2)),
+        sa.Column("cantidad", sa.Numeric(10, 3)),
+        sa.Column("precio_total_linea", sa.Numeric(10, 2), nullable=False),
+        sa.Column("fecha_item", sa.Date(), nullable=False),
+        sa.PrimaryKeyConstraint("id", "fecha_item"),
+        postgresql_partition_by="RANGE (fecha_item)",
+    )
+    op.create_index(
+        "ix_items_household_id_fecha_item",
+        "items",
+        ["household_id", "fecha_item"],
+    )
+
+    today = date.today()
+    if context.is_offline_mode():
+        _create_offline_item_partitions(today)
+    else:
+        conn = op.get_bind()
+        data_months = conn.execute(
+            sa.text(
+                "SELECT DISTINCT date_trunc('month', fecha_item)::date "
+                "FROM items_unpartitioned WHERE fecha_item >= :low AND fecha_item < :high"
+            ),
+            {
+                "low": partitions.add_months(today, -12 * PLAUSIBLE_YEARS_BACK),
+                "high": partitions.add_months(today, 12 * PLAUSIBLE_YEARS_AHEAD),
+            },
+        ).scalars()
+        partitions.create_default_item_partition(conn)
+        partitions.ensure_item_partitions(
+            conn, list(data_months) + partitions.partition_window(today, 1, 3)
+        )
+
+    op.execute(
+        f"INSERT INTO items (household_id, {ITEM_COLUMNS}) "
+        f"SELECT t.household_id, i.{ITEM_COLUMNS.replace(', ', ', i.')} "
+        "FROM items_unpartitioned i JOIN tickets t ON t.id = i.ticket_id"
+    )
+    op.drop_table("items_unpartitioned")
+
+
+def _create_offline_item_partitions(today: date):
+    """
+    `alembic upgrade --sql` has no connection to find the months holding data:
+    only the DEFAULT partition and the upcoming months are emitted, older rows
+    stay in DEFAULT (run `python -m src.database.partitions --months-back N`
+    afterwards to move them to monthly partitions).
+    """
+    op.execute(
+        f"CREATE TABLE {partitions.ITEMS_DEFAULT_PARTITION} PARTITION OF items DEFAULT"
+    )
+    for month in partitions.partition_window(today, 1, 3):
+        name, start, end = partitions.item_partition_bounds(month)
+        op.execute(
+            f"CREATE TABLE {name} PARTITION OF items "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_table(
+        "items_unpartitioned",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "ticket_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("tickets.id"),
+            nullable=False,
+        ),
+        sa.Column("nombre_producto", sa.String(), nullable=False),
+        sa.Column("categoria", sa.String()),
+        sa.Column("precio_unitario", sa.Numeric(10, 2)),
+        sa.Column("cantidad", sa.Numeric(10, 3)),
+        sa.Column("precio_total_linea", sa.Numeric(10, 2), nullable=False),
+        sa.Column("fecha_item", sa.Date(), nullable=False),
+    )
+    op.execute(
+        f"INSERT INTO items_unpartitioned ({ITEM_COLUMNS}) "
+        f"SELECT {ITEM_COLUMNS} FROM items"
+    )
+    # Dropping the partitioned table drops all of its partitions
+    op.drop_table("items")
+    op.rename_table("items_unpartitioned", "items")
+    op.execute("ALTER INDEX items_unpartitioned_pkey RENAME TO items_pkey")
+    op.execute(
+        "ALTER TABLE items RENAME CONSTRAINT items_unpartitioned_ticket_id_fkey "
+        "TO items_ticket_id_fkey"
+    )
+
+    op.drop_index("ix_tickets_household_id_fecha_compra", table_name="tickets")
+    op.drop_column("tickets", "household_id")
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Column, Date, ForeignKey, Numeric, String
+from sqlalchemy import Column, Date, ForeignKey, Index, Numeric, String
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import declarative_base, relationship
 
@@ -9,8 +9,12 @@ Base = declarative_base()
 
 class Ticket(Base):
     __tablename__ = "tickets"
+    __table_args__ = (
+        Index("ix_tickets_household_id_fecha_compra", "household_id", "fecha_compra"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    household_id = Column(String, nullable=False)
     fecha_compra = Column(Date, nullable=False)
     supermercado = Column(String)
     total_ticket = Column(Numeric(10, 2), nullable=False)
@@ -24,15 +28,22 @@ class Ticket(Base):
 
 class Item(Base):
     __tablename__ = "items"
+    # Items are range partitioned by month on fecha_item (see src/database/partitions.py),
+    # so the partition key must be part of the primary key
+    __table_args__ = (
+        Index("ix_items_household_id_fecha_item", "household_id", "fecha_item"),
+        {"postgresql_partition_by": "RANGE (fecha_item)"},
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    household_id = Column(String, nullable=False)
     ticket_id = Column(UUID(as_uuid=True), ForeignKey("tickets.id"), nullable=False)
     nombre_producto = Column(String, nullable=False)
     categoria = Column(String)
     precio_unitario = Column(Numeric(10, 2))
     cantidad = Column(Numeric(10, 3))  #
     precio_total_linea = Column(Numeric(10, 2), nullable=False)
-    fecha_item = Column(Date, nullable=False)
+    fecha_item = Column(Date, primary_key=True)
     ticket = relationship("Ticket", back_populates="items")
 
     def __repr__(self):
@@ -0,0 +1,127 @@
+"""
+Maintenance of the monthly `items` partitions.
+
+Partitions are created ahead of time, never on the ingest path. Items whose
+month has no partition (e.g. a date misread from the receipt) land in the
+DEFAULT partition. Run this once per deploy and periodically (e.g. monthly
+from cron) to keep upcoming months covered:
+
+    python -m src.database.partitions --months-back 1 --months-ahead 3
+"""
+
+import argparse
+from datetime import date
+from typing import Iterable
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from src.database.connection import get_engine
+
+ITEMS_DEFAULT_PARTITION = "items_default"
+
+# Serializes partition DDL between concurrent maintenance runs and migrations
+_PARTITION_LOCK_SQL = (
+    "SELECT pg_advisory_xact_lock(hashtext('homesync_items_partitions'))"
+)
+
+
+def item_partition_bounds(item_date: date):
+    """
+    Returns the (name, start, end) of the monthly `items` partition holding item_date.
+    """
+    start = item_date.replace(day=1)
+    return f"items_y{start.year}m{start.month:02d}", start, add_months(start, 1)
+
+
+def add_months(day: date, months: int) -> date:
+    """
+    Returns the first day of the month `months` months away from day.
+    """
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_window(today: date, months_back: int, months_ahead: int):
+    """
+    Returns the first day of every month from months_back before today to months_ahead after it.
+    """
+    first = today.replace(day=1)
+    return [add_months(first, n) for n in range(-months_back, months_ahead + 1)]
+
+
+def create_default_item_partition(conn: Connection):
+    """
+    Creates the DEFAULT `items` partition, catching items of months without a partition.
+    """
+    conn.execute(text(_PARTITION_LOCK_SQL))
+    conn.execute(
+        text(
+            f"CREATE TABLE IF NOT EXISTS {ITEMS_DEFAULT_PARTITION} "
+            "PARTITION OF items DEFAULT"
+        )
+    )
+
+
+def _create_item_partition(conn: Connection, month: date) -> bool:
+    name, start, end = item_partition_bounds(month)
+    if conn.execute(text("SELECT to_regclass(:name)"), {"name": name}).scalar():
+        return False
+
+    # Build the partition detached, move the month's rows out of the DEFAULT
+    # partition, then attach it (attaching fails if DEFAULT still holds them)
+    conn.execute(
+        text(
+            f"CREATE TABLE {name} (LIKE items INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        )
+    )
+    conn.execute(
+        text(
+            f"WITH moved AS (DELETE FROM {ITEMS_DEFAULT_PARTITION} "
+            "WHERE fecha_item >= :start AND fecha_item < :end RETURNING *) "
+            f"INSERT INTO {name} SELECT * FROM moved"
+        ),
+        {"start": start, "end": end},
+    )
+    conn.execute(
+        text(
+            f"ALTER TABLE items ATTACH PARTITION {name} "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+    )
+    return True
+
+
+def ensure_item_partitions(conn: Connection, months: Iterable[date]):
+    """
+    Creates the monthly `items` partitions of the given months that do not exist yet.
+
+    Runs under a transaction scoped advisory lock, so concurrent runs do not race
+    on the same partition. The caller owns (and commits) the transaction.
+
+    :param conn: Connection to the primary database, inside a transaction.
+    :param months: Any day of each month to cover.
+    :return: Names of the partitions created.
+    """
+    conn.execute(text(_PARTITION_LOCK_SQL))
+    created = []
+    for month in sorted({month.replace(day=1) for month in months}):
+        if _create_item_partition(conn, month):
+            created.append(item_partition_bounds(month)[0])
+    return created
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--months-back", type=int, default=1)
+    parser.add_argument("--months-ahead", type=int, default=3)
+    args = parser.parse_args()
+
+    months = partition_window(date.today(), args.months_back, args.months_ahead)
+    with get_engine().begin() as conn:
+        created = ensure_item_partitions(conn, months)
+    print(f"Item partitions created: {', '.join(created) or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,42 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from cfg import settings
+from src.api.compression import CompressionMiddleware
+from src.api.responses import FastJSONResponse
 from src.api.routes import router
-from src.database.connection import create_db_and_tables
+from src.database.connection import (
+    dispose_engines,
+    get_replica_engines,
+    monitor_replicas,
+)
+
 
-app = FastAPI(title="HomeSync AI Backend")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Database engines and the Gemini client are created lazily on first use,
+    # and the schema is migrated once with `alembic upgrade head` before the
+    # workers start, so there is nothing heavy to do at worker boot
+    replica_monitor = None
+    if get_replica_engines():
+        replica_monitor = asyncio.create_task(monitor_replicas())
+    yield
+    if replica_monitor is not None:
+        replica_monitor.cancel()
+        with suppress(asyncio.CancelledError):
+            await replica_monitor
+    print("Closing database connection pools...")
+    dispose_engines()
+
+
+app = FastAPI(
+    title="HomeSync AI Backend",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
+)
 
 
 # Config CORS
@@ -26,12 +57,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Negotiated brotli/gzip compression of large responses (e.g. extracted ticket data)
+app.add_middleware(
+    CompressionMiddleware, minimum_size=settings.compression_minimum_size
+)
+
 
-@app.on_event("startup")
-def on_startup():
-    print("Creating database tables if they don't exist...")
-    create_db_and_tables()
-    print("Database tables check complete.")
+@app.get("/health")
+def health():
+    """
+    Liveness endpoint, does not touch the database or Gemini.
+    """
+    return {"status": "ok"}
 
 
 app.include_router(router, prefix="/api/v1")
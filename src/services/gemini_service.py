@@ -1,9 +1,8 @@
 import base64
+import functools
 import json
 from typing import List, Optional
 
-from google import genai
-from google.genai import types
 from pydantic import BaseModel
 
 from cfg import logger, settings
@@ -11,11 +10,20 @@ from cfg import logger, settings
 # Cargar variables de entorno
 # load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
 
-if not settings.gemini_api_key:
-    raise ValueError("GEMINI_API_KEY no está configurada en el archivo .env")
+# google.genai is imported inside the functions that use it: it is the slowest
+# import of the backend and is not needed until the first Gemini call
 
 
-client = genai.Client(api_key=settings.gemini_api_key)
+@functools.lru_cache(maxsize=None)
+def get_client():
+    """
+    Returns the shared Gemini client, creating it on first use.
+    """
+    from google import genai
+
+    if not settings.gemini_api_key:
+        raise ValueError("GEMINI_API_KEY no está configurada en el archivo .env")
+    return genai.Client(api_key=settings.gemini_api_key)
 
 
 class InvoiceItem(BaseModel):
@@ -40,6 +48,8 @@ async def process_image_with_gemini(base64_image: str, prompt: str):
     The prompt should instruct Gemini to extract specific data from the image.
     Returns a JSON response with the extracted data.
     """
+    from google.genai import types
+
     try:
         logger.info("🔍 Starting image processing")
         logger.debug(f"📏 Base64 length: {len(base64_image)}")
@@ -62,7 +72,7 @@ async def process_image_with_gemini(base64_image: str, prompt: str):
         try:
             logger.info("⏳ Waiting for response from Gemini...")
             # Structured response with schema
-            response = client.models.generate_content(
+            response = await get_client().aio.models.generate_content(
                 model=settings.model_id,
                 contents=[
                     types.Content(
@@ -104,7 +114,7 @@ async def process_image_with_gemini(base64_image: str, prompt: str):
             # Fallback: intentar sin esquema estructurado
             logger.info("🔄 Trying without structured schema...")
             try:
-                response = client.models.generate_content(
+                response = await get_client().aio.models.generate_content(
                     model=settings.model_id,
                     contents=[
                         types.Content(
@@ -163,6 +173,8 @@ async def process_text_with_gemini(text: str, prompt: str):
     """
     Send a text to Gemini Pro along with a text prompt.
     """
+    from google.genai import types
+
     try:
         logger.info("🔍 Starting text processing with Gemini...")
         logger.info(f"💬 Prompt: {prompt[:100]}...")
@@ -170,7 +182,7 @@ async def process_text_with_gemini(text: str, prompt: str):
 
         full_prompt = f"{prompt}\n\nText to process: {text}"
 
-        response = client.models.generate_content(
+        response = await get_client().aio.models.generate_content(
             model=settings.model_id,
             contents=[types.Content(role="user", parts=[types.Part(text=full_prompt)])],
         )
@@ -207,8 +219,10 @@ async def test_gemini_connection():
     """
     Simple function to test that Gemini is working
     """
+    from google.genai import types
+
     try:
-        response = client.models.generate_content(
+        response = await get_client().aio.models.generate_content(
             model=settings.model_id,
             contents=[
                 types.Content(
@@ -0,0 +1,106 @@
+import asyncio
+import hashlib
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from cachetools import TTLCache
+
+from cfg import logger, settings
+
+
+class IdempotencyKeyMismatch(ValueError):
+    """
+    Raised when a key is reused for a request with a different payload.
+    """
+
+
+class SingleFlightCache:
+    """
+    Coalesces concurrent calls that share a key into a single computation.
+
+    While a computation is in flight, every caller with a matching key awaits
+    the same task. Once it completes successfully, the result is kept for
+    `ttl_seconds` so that late retries get the stored result instead of
+    recomputing it. At most `max_entries` completed keys are kept, the least
+    recently used are evicted first. Failed computations are not stored.
+
+    Each entry remembers the fingerprint of the request that created it, so a
+    key reused with a different payload is rejected instead of being served
+    someone else's result.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 10_000):
+        self.ttl_seconds = ttl_seconds
+        # key -> (task, request fingerprint), while the computation runs
+        self._in_flight: Dict[str, Tuple[asyncio.Task, str]] = {}
+        # key -> (completed task, request fingerprint), expired and evicted by TTLCache
+        self._completed = TTLCache(
+            maxsize=max_entries, ttl=ttl_seconds, timer=time.monotonic
+        )
+
+    def _get(self, key: str):
+        return self._in_flight.get(key) or self._completed.get(key)
+
+    def _find(self, keys: List[str], fingerprint: str):
+        task = None
+        for key in keys:
+            entry = self._get(key)
+            if entry is None:
+                continue
+            if entry[1] != fingerprint:
+                raise IdempotencyKeyMismatch(
+                    f"Key '{key}' was already used for a different request"
+                )
+            task = task or entry[0]
+        return task
+
+    async def run(
+        self, keys: List[str], fingerprint: str, func: Callable[[], Awaitable[Any]]
+    ):
+        """
+        Runs `func` once for all the given keys and returns its result.
+
+        :param keys: Aliases identifying the computation (e.g. idempotency key and image hash).
+        :param fingerprint: Hash of the request payload, must match the one stored for every known key.
+        :param func: Coroutine function performing the actual work.
+        :return: The result of the (possibly shared) computation.
+        :raises IdempotencyKeyMismatch: If a key is known with a different fingerprint.
+        """
+        task = self._find(keys, fingerprint)
+        if task is not None:
+            logger.info("♻️ Attaching to existing computation for duplicate request")
+        else:
+            task = asyncio.ensure_future(func())
+            for key in keys:
+                self._in_flight[key] = (task, fingerprint)
+            task.add_done_callback(lambda t: self._on_done(keys, t))
+
+        # Shield the shared task so that a cancelled caller does not cancel it for everyone else
+        return await asyncio.shield(task)
+
+    def _on_done(self, keys: List[str], task: asyncio.Task):
+        failed = task.cancelled() or task.exception() is not None
+        for key in keys:
+            entry = self._in_flight.get(key)
+            if entry is None or entry[0] is not task:
+                continue
+            del self._in_flight[key]
+            if not failed:
+                self._completed[key] = entry
+
+
+def image_hash(base64_image: str, prompt: str) -> str:
+    """
+    Returns a stable hash for an image/prompt pair, used to detect duplicate uploads.
+    """
+    digest = hashlib.sha256()
+    digest.update(prompt.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(base64_image.encode("utf-8"))
+    return digest.hexdigest()
+
+
+ticket_cache = SingleFlightCache(
+    ttl_seconds=settings.idempotency_ttl_seconds,
+    max_entries=settings.idempotency_max_entries,
+)
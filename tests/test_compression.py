@@ -0,0 +1,150 @@
+import gzip
+
+import brotli
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.api import compression
+from src.api.compression import (
+    THREAD_MINIMUM_SIZE,
+    CompressionMiddleware,
+    _accepted_encodings,
+    choose_encoding,
+)
+
+SMALL_BODY = "x" * 100
+LARGE_BODY = "homesync " * 200
+
+app = FastAPI()
+app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+
+@app.get("/small")
+def small():
+    return PlainTextResponse(SMALL_BODY)
+
+
+@app.get("/large")
+def large():
+    return PlainTextResponse(LARGE_BODY)
+
+
+@app.get("/huge")
+def huge():
+    return PlainTextResponse("y" * (THREAD_MINIMUM_SIZE + 1))
+
+
+@app.get("/stream")
+def stream():
+    return StreamingResponse(iter([LARGE_BODY, LARGE_BODY]), media_type="text/plain")
+
+
+@app.get("/image")
+def image():
+    return Response(LARGE_BODY.encode(), media_type="image/png")
+
+
+@app.get("/encoded")
+def encoded():
+    body = gzip.compress(LARGE_BODY.encode())
+    return Response(body, media_type="text/plain", headers={"Content-Encoding": "gzip"})
+
+
+client = TestClient(app)
+
+
+def get(path, accept_encoding):
+    # Read the raw bytes, so the assertions see exactly what was sent on the wire
+    with client.stream(
+        "GET", path, headers={"Accept-Encoding": accept_encoding}
+    ) as response:
+        return response, b"".join(response.iter_raw())
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("gzip, deflate, br", {"gzip", "deflate", "br"}),
+        ("GZIP;q=0.5, br;q=1.0", {"gzip", "br"}),
+        ("br;q=0, gzip", {"gzip"}),
+        ("gzip;q=0.000", set()),
+        ("gzip;q=oops", {"gzip"}),
+        ("", set()),
+    ],
+)
+def test_accepted_encodings(header, expected):
+    assert _accepted_encodings(header) == expected
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("gzip, br", "br"),
+        ("gzip, br;q=0", "gzip"),
+        ("br;q=0, gzip;q=0", None),
+        ("deflate", None),
+        ("identity", None),
+    ],
+)
+def test_choose_encoding(header, expected):
+    assert choose_encoding(header) == expected
+
+
+def test_choose_encoding_without_brotli(monkeypatch):
+    monkeypatch.setattr(compression, "brotli", None)
+
+    assert choose_encoding("br, gzip") == "gzip"
+    assert choose_encoding("br") is None
+
+
+def test_large_response_is_compressed():
+    response, body = get("/large", "br, gzip")
+
+    assert response.headers["content-encoding"] == "br"
+    assert response.headers["content-length"] == str(len(body))
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert brotli.decompress(body).decode() == LARGE_BODY
+
+    response, body = get("/large", "gzip")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(body).decode() == LARGE_BODY
+
+
+def test_huge_response_is_compressed_in_a_thread():
+    response, body = get("/huge", "gzip")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(gzip.decompress(body)) == THREAD_MINIMUM_SIZE + 1
+
+
+@pytest.mark.parametrize(
+    "path, accept_encoding",
+    [
+        ("/small", "gzip"),
+        ("/large", "identity"),
+        ("/large", "gzip;q=0"),
+        ("/image", "gzip"),
+    ],
+)
+def test_response_is_not_compressed(path, accept_encoding):
+    response, body = get(path, accept_encoding)
+
+    assert "content-encoding" not in response.headers
+    assert body.decode() == {"/small": SMALL_BODY}.get(path, LARGE_BODY)
+
+
+def test_streaming_response_passes_through():
+    response, body = get("/stream", "gzip")
+
+    assert "content-encoding" not in response.headers
+    assert body.decode() == LARGE_BODY * 2
+
+
+def test_already_encoded_response_is_not_compressed_again():
+    response, body = get("/encoded", "gzip")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(body).decode() == LARGE_BODY
@@ -0,0 +1,172 @@
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, insert, select, text
+from sqlalchemy.exc import InterfaceError, ProgrammingError
+from sqlalchemy.schema import CreateTable
+
+from src.database import connection
+from src.database.models import Ticket
+
+
+@pytest.fixture
+def engines(monkeypatch):
+    primary = create_engine("sqlite://")
+    replica = create_engine("sqlite://")
+    monkeypatch.setattr(connection, "get_engine", lambda: primary)
+    monkeypatch.setattr(connection, "get_replica_engines", lambda: [replica])
+    monkeypatch.setattr(connection, "_pick_replica", lambda: replica)
+    return primary, replica
+
+
+@pytest.mark.parametrize(
+    "clause",
+    [
+        text("INSERT INTO tickets (id) VALUES (1)"),
+        text("  update tickets SET total_ticket = 0"),
+        text("DELETE FROM tickets"),
+        text("CREATE TABLE t (id int)"),
+        text("WITH moved AS (DELETE FROM t RETURNING *) SELECT * FROM moved"),
+        insert(Ticket),
+        CreateTable(Ticket.__table__),
+    ],
+)
+def test_writes_go_to_primary_and_pin_the_session(engines, clause):
+    primary, replica = engines
+    db = connection.RoutingSession()
+    db.info["use_replica"] = True
+
+    assert db.get_bind(clause=clause) is primary
+    assert db.info["has_writes"]
+    assert db.get_bind(clause=select(Ticket)) is primary
+
+
+@pytest.mark.parametrize(
+    "clause", [select(Ticket), text("SELECT 1"), text("explain SELECT 1")]
+)
+def test_reads_go_to_replica(engines, clause):
+    primary, replica = engines
+    db = connection.RoutingSession()
+    db.info["use_replica"] = True
+
+    assert db.get_bind(clause=clause) is replica
+    assert not db.info.get("has_writes")
+
+
+def test_raw_connection_counts_as_write(engines):
+    primary, replica = engines
+    db = connection.RoutingSession()
+    db.info["use_replica"] = True
+
+    assert db.get_bind() is primary
+    assert db.info["has_writes"]
+
+
+class FakeReplica:
+    """
+    Engine stand-in whose health check query returns the given lag.
+    """
+
+    url = create_engine("postgresql://replica/db").url
+
+    def __init__(self, lag, error=None):
+        self.lag = lag
+        self.error = error
+
+    def connect(self):
+        if self.error is not None:
+            raise self.error
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, statement):
+        return self
+
+    def scalar(self):
+        return self.lag
+
+
+def test_replica_health_considers_lag(monkeypatch):
+    monkeypatch.setattr(connection.settings, "replica_max_lag_seconds", 5.0)
+
+    assert connection.check_replica(FakeReplica(0))
+    assert connection.check_replica(FakeReplica(4.5))
+    assert not connection.check_replica(FakeReplica(30))
+
+
+def test_unreachable_replica_is_unhealthy():
+    # SQLite has no pg_last_* functions: the query fails like a dead replica
+    assert not connection.check_replica(create_engine("sqlite://"))
+
+
+def test_replicas_unused_until_checked(monkeypatch):
+    replica = FakeReplica(0)
+    monkeypatch.setattr(connection, "get_replica_engines", lambda: [replica])
+    monkeypatch.setattr(connection, "_get_replica_cycle", lambda: iter([replica] * 2))
+    monkeypatch.setattr(connection, "_replica_health", {})
+
+    assert connection._pick_replica() is None
+    connection.check_replicas()
+    assert connection._pick_replica() is replica
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        InterfaceError("SELECT 1", {}, Exception("connection closed")),
+        ProgrammingError("SELECT 1", {}, Exception("permission denied")),
+        RuntimeError("driver bug"),
+    ],
+)
+def test_any_check_failure_marks_replica_unhealthy(error):
+    assert not connection.check_replica(FakeReplica(0, error=error))
+
+
+def test_replica_marked_unhealthy_recovers_on_next_check(monkeypatch):
+    replica = FakeReplica(0)
+    monkeypatch.setattr(connection, "get_replica_engines", lambda: [replica])
+    monkeypatch.setattr(connection, "_replica_health", {})
+
+    connection.mark_replica_unhealthy(replica)
+    connection.check_replicas()
+
+    assert connection._replica_health[replica]
+
+
+def test_monitor_survives_failing_checks(monkeypatch):
+    replica = FakeReplica(0)
+    calls = []
+
+    def flaky_check_replicas():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        connection._replica_health[replica] = True
+
+    monkeypatch.setattr(connection, "get_replica_engines", lambda: [replica])
+    monkeypatch.setattr(connection, "_replica_health", {replica: True})
+    monkeypatch.setattr(connection, "check_replicas", flaky_check_replicas)
+    monkeypatch.setattr(connection.settings, "replica_health_check_interval", 0.01)
+
+    async def wait_for_health(healthy):
+        while connection._replica_health[replica] is not healthy:
+            await asyncio.sleep(0.001)
+
+    async def scenario():
+        monitor = asyncio.create_task(connection.monitor_replicas())
+        # The failed round leaves the replica out instead of keeping its stale
+        # state, and the next round brings it back
+        await asyncio.wait_for(wait_for_health(False), timeout=5)
+        await asyncio.wait_for(wait_for_health(True), timeout=5)
+        monitor.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await monitor
+
+    asyncio.run(scenario())
+    assert len(calls) >= 2
+    assert connection._replica_health[replica]
@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+
+from src.services.idempotency_service import (
+    IdempotencyKeyMismatch,
+    SingleFlightCache,
+    image_hash,
+)
+
+
+class Counter:
+    """
+    Coroutine function counting its calls, optionally slow or failing.
+    """
+
+    def __init__(self, delay=0.0, error=None):
+        self.calls = 0
+        self.delay = delay
+        self.error = error
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return {"n": self.calls}
+
+
+def test_concurrent_duplicates_share_one_computation():
+    cache = SingleFlightCache(ttl_seconds=60)
+    work = Counter(delay=0.05)
+
+    async def scenario():
+        return await asyncio.gather(
+            cache.run(["key:k1", "image:img"], "img", work),
+            cache.run(["image:img"], "img", work),
+            cache.run(["key:k2", "image:img"], "img", work),
+        )
+
+    assert asyncio.run(scenario()) == [{"n": 1}] * 3
+    assert work.calls == 1
+
+
+def test_completed_result_is_replayed_within_ttl():
+    cache = SingleFlightCache(ttl_seconds=60)
+    work = Counter()
+
+    async def scenario():
+        first = await cache.run(["key:k1", "image:img"], "img", work)
+        second = await cache.run(["key:k1", "image:img"], "img", work)
+        return first, second
+
+    assert asyncio.run(scenario()) == ({"n": 1}, {"n": 1})
+    assert work.calls == 1
+
+
+def test_result_expires_after_ttl():
+    cache = SingleFlightCache(ttl_seconds=0.01)
+    work = Counter()
+
+    async def scenario():
+        await cache.run(["image:img"], "img", work)
+        await asyncio.sleep(0.05)
+        return await cache.run(["image:img"], "img", work)
+
+    assert asyncio.run(scenario()) == {"n": 2}
+    assert work.calls == 2
+
+
+def test_failures_are_evicted():
+    cache = SingleFlightCache(ttl_seconds=60)
+    failing = Counter(error=RuntimeError("gemini down"))
+    work = Counter()
+
+    async def scenario():
+        with pytest.raises(RuntimeError):
+            await cache.run(["key:k1", "image:img"], "img", failing)
+        return await cache.run(["key:k1", "image:img"], "img", work)
+
+    assert asyncio.run(scenario()) == {"n": 1}
+    assert failing.calls == 1
+    assert work.calls == 1
+
+
+def test_key_reused_with_different_payload_is_rejected():
+    cache = SingleFlightCache(ttl_seconds=60)
+    work = Counter()
+
+    async def scenario():
+        await cache.run(["key:k1", "image:img"], "img", work)
+        with pytest.raises(IdempotencyKeyMismatch):
+            await cache.run(["key:k1", "image:img2"], "img2", work)
+
+    asyncio.run(scenario())
+    assert work.calls == 1
+
+
+def test_key_reused_while_in_flight_is_rejected():
+    cache = SingleFlightCache(ttl_seconds=60)
+    work = Counter(delay=0.05)
+
+    async def scenario():
+        first = asyncio.ensure_future(cache.run(["key:k1"], "img", work))
+        await asyncio.sleep(0)
+        with pytest.raises(IdempotencyKeyMismatch):
+            await cache.run(["key:k1"], "img2", work)
+        return await first
+
+    assert asyncio.run(scenario()) == {"n": 1}
+    assert work.calls == 1
+
+
+def test_image_hash_depends_on_image_and_prompt():
+    assert image_hash("aW1n", "prompt") == image_hash("aW1n", "prompt")
+    assert image_hash("aW1n", "prompt") != image_hash("aW1nMg==", "prompt")
+    assert image_hash("aW1n", "prompt") != image_hash("aW1n", "other prompt")
+
+
+def test_completed_entries_are_bounded():
+    cache = SingleFlightCache(ttl_seconds=60, max_entries=2)
+    work = Counter()
+
+    async def scenario():
+        for image in ("img1", "img2", "img3"):
+            await cache.run([f"image:{image}"], image, work)
+        return await cache.run(["image:img1"], "img1", work)
+
+    # img1 was evicted to make room for img3, so it is computed again
+    assert asyncio.run(scenario()) == {"n": 4}
+    assert len(cache._completed) == 2
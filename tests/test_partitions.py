@@ -0,0 +1,30 @@
+from datetime import date
+
+from src.database.partitions import add_months, item_partition_bounds, partition_window
+
+
+def test_item_partition_bounds_cover_the_month():
+    assert item_partition_bounds(date(2026, 10, 18)) == (
+        "items_y2026m10",
+        date(2026, 10, 1),
+        date(2026, 11, 1),
+    )
+    assert item_partition_bounds(date(2026, 12, 31))[1:] == (
+        date(2026, 12, 1),
+        date(2027, 1, 1),
+    )
+
+
+def test_add_months_crosses_years():
+    assert add_months(date(2026, 1, 15), -1) == date(2025, 12, 1)
+    assert add_months(date(2026, 11, 30), 2) == date(2027, 1, 1)
+    assert add_months(date(2026, 3, 1), -120) == date(2016, 3, 1)
+
+
+def test_partition_window():
+    assert partition_window(date(2026, 12, 5), 1, 2) == [
+        date(2026, 11, 1),
+        date(2026, 12, 1),
+        date(2027, 1, 1),
+        date(2027, 2, 1),
+    ]
@@ -0,0 +1,53 @@
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+from pydantic import BaseModel
+
+from src.api.responses import FastJSONResponse
+
+
+class Item(BaseModel):
+    nombre_producto: str
+    precio_unitario: Decimal
+    fecha_item: date
+
+
+def test_renders_models_decimals_dates_uuids_and_non_str_keys():
+    content = {
+        "ticket_id": UUID("12345678-1234-5678-1234-567812345678"),
+        "fecha_compra": date(2026, 10, 18),
+        "creado": datetime(2026, 10, 18, 9, 30),
+        "total": Decimal("12.50"),
+        "unidades": Decimal("3"),
+        "items": [
+            Item(
+                nombre_producto="Leche",
+                precio_unitario=Decimal("0.99"),
+                fecha_item=date(2026, 10, 18),
+            )
+        ],
+        "por_mes": {date(2026, 10, 1): Decimal("12.50"), 2026: 1},
+        "categorias": {"dairy"},
+    }
+
+    assert FastJSONResponse(content).body == (
+        b'{"ticket_id":"12345678-1234-5678-1234-567812345678",'
+        b'"fecha_compra":"2026-10-18",'
+        b'"creado":"2026-10-18T09:30:00",'
+        b'"total":12.5,'
+        b'"unidades":3,'
+        b'"items":[{"nombre_producto":"Leche","precio_unitario":0.99,"fecha_item":"2026-10-18"}],'
+        b'"por_mes":{"2026-10-01":12.5,"2026":1},'
+        b'"categorias":["dairy"]}'
+    )
+
+
+def test_integral_decimal_with_exponent_is_an_int():
+    assert FastJSONResponse({"total": Decimal("1E+2")}).body == b'{"total":100}'
+
+
+def test_unsupported_types_are_rejected():
+    with pytest.raises(TypeError):
+        FastJSONResponse({"value": object()})
@@ -0,0 +1,75 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api import routes
+from src.main import app
+
+client = TestClient(app)
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {},
+        {"X-Household-Id": ""},
+        {"X-Household-Id": "bad id!"},
+        {"X-Household-Id": "x" * 65},
+    ],
+)
+def test_household_header_is_required_and_validated(headers):
+    response = client.post(
+        "/api/v1/process_voice_command",
+        json={"command_text": "How much did I spend on dairy this month?"},
+        headers=headers,
+    )
+
+    assert response.status_code == 400
+    assert "X-Household-Id" in response.json()["detail"]
+
+
+def test_long_idempotency_key_is_rejected():
+    response = client.post(
+        "/api/v1/process_ticket",
+        json={"image_base64": "aW1n"},
+        headers={"X-Household-Id": "home-1", "Idempotency-Key": "k" * 256},
+    )
+
+    assert response.status_code == 400
+    assert "Idempotency-Key" in response.json()["detail"]
+
+
+def test_process_ticket_uses_its_own_session(monkeypatch):
+    sessions = []
+
+    class FakeSession:
+        closed = False
+
+        def __init__(self):
+            sessions.append(self)
+
+        def close(self):
+            self.closed = True
+
+    async def fake_gemini(base64_image, prompt):
+        return json.dumps({"parsed": {"total": 1}})
+
+    def fake_save(db, household_id, data):
+        assert not db.closed
+        return SimpleNamespace(id="ticket-1")
+
+    monkeypatch.setattr(routes, "SessionLocal", FakeSession)
+    monkeypatch.setattr(routes.gemini_service, "process_image_with_gemini", fake_gemini)
+    monkeypatch.setattr(routes.crud, "save_gemini_ticket_data", fake_save)
+
+    response = client.post(
+        "/api/v1/process_ticket",
+        json={"image_base64": "dGlja2V0LXNlc3Npb24="},
+        headers={"X-Household-Id": "home-1", "Idempotency-Key": "k" * 255},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["ticket_id"] == "ticket-1"
+    assert len(sessions) == 1 and sessions[0].closed